@@ -1,388 +1,959 @@
-"""
-Database Manager - Per-user SQLite with SQLAlchemy models
-Each user gets isolated database with full CRM schema
-"""
-
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, Date
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from datetime import datetime
-from fastapi import Header, HTTPException
-import os
-
-# ══════════════════════════════════════════════════════════════
-# CONFIGURATION
-# ══════════════════════════════════════════════════════════════
-
-DB_DIR = os.path.join(os.path.dirname(__file__), "user_databases")
-os.makedirs(DB_DIR, exist_ok=True)
-
-Base = declarative_base()
-
-# Session cache
-_sessions = {}
-_engines = {}
-
-# ══════════════════════════════════════════════════════════════
-# MODELS
-# ══════════════════════════════════════════════════════════════
-
-class Contact(Base):
-    """Contact/Lead entity"""
-    __tablename__ = "contacts"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    first_name = Column(String(100), nullable=False, index=True)
-    last_name = Column(String(100), nullable=False, index=True)
-    email = Column(String(255), unique=True, nullable=False, index=True)
-    phone = Column(String(50))
-    mobile = Column(String(50))
-    title = Column(String(100))
-    department = Column(String(100))
-    company_id = Column(Integer, index=True)
-    linkedin_url = Column(String(255))
-    twitter_handle = Column(String(100))
-    street = Column(String(255))
-    city = Column(String(100))
-    state = Column(String(100))
-    country = Column(String(100))
-    postal_code = Column(String(20))
-    status = Column(String(50), default="lead", index=True)
-    lead_source = Column(String(100))
-    lead_score = Column(Integer, default=0)
-    tags = Column(Text)
-    notes = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-
-class Company(Base):
-    """Company/Account entity"""
-    __tablename__ = "companies"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(255), nullable=False, index=True)
-    website = Column(String(255))
-    industry = Column(String(100), index=True)
-    company_size = Column(String(50))
-    annual_revenue = Column(Float)
-    phone = Column(String(50))
-    email = Column(String(255))
-    street = Column(String(255))
-    city = Column(String(100))
-    state = Column(String(100))
-    country = Column(String(100))
-    postal_code = Column(String(20))
-    company_type = Column(String(50), default="prospect", index=True)
-    priority = Column(String(20), default="medium")
-    description = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-
-class Deal(Base):
-    """Deal/Opportunity entity"""
-    __tablename__ = "deals"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String(255), nullable=False)
-    value = Column(Float, nullable=False)
-    stage = Column(String(50), default="qualification", index=True)
-    status = Column(String(20), default="open", index=True)
-    probability = Column(Integer, default=10)
-    expected_close_date = Column(Date)
-    actual_close_date = Column(Date)
-    contact_id = Column(Integer, index=True)
-    company_id = Column(Integer, index=True)
-    description = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-
-class Activity(Base):
-    """Activity entity (calls, meetings, tasks, etc.)"""
-    __tablename__ = "activities"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    activity_type = Column(String(50), nullable=False, index=True)
-    subject = Column(String(255), nullable=False)
-    description = Column(Text)
-    activity_date = Column(DateTime, nullable=False, index=True)
-    duration_minutes = Column(Integer)
-    contact_id = Column(Integer, index=True)
-    company_id = Column(Integer, index=True)
-    deal_id = Column(Integer, index=True)
-    status = Column(String(50), default="pending", index=True)
-    priority = Column(String(20), default="medium")
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-
-
-class Note(Base):
-    """Note entity for attachments to contacts/companies/deals"""
-    __tablename__ = "notes"
-    
-    id = Column(Integer, primary_key=True, index=True)
-    content = Column(Text, nullable=False)
-    contact_id = Column(Integer, index=True)
-    company_id = Column(Integer, index=True)
-    deal_id = Column(Integer, index=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
-
-
-# ══════════════════════════════════════════════════════════════
-# DATABASE FUNCTIONS
-# ══════════════════════════════════════════════════════════════
-
-def get_db_path(user_id: str) -> str:
-    """Get database file path for user"""
-    return os.path.join(DB_DIR, f"crm_{user_id}.db")
-
-
-def init_user_db(user_id: str) -> str:
-    """
-    Initialize new SQLite database for user
-    Creates all tables and returns path
-    """
-    db_path = get_db_path(user_id)
-    
-    engine = create_engine(
-        f"sqlite:///{db_path}",
-        connect_args={"check_same_thread": False},
-        pool_pre_ping=True
-    )
-    
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
-    
-    # Cache engine
-    _engines[user_id] = engine
-    
-    return db_path
-
-
-def get_engine(user_id: str):
-    """Get or create engine for user"""
-    if user_id in _engines:
-        return _engines[user_id]
-    
-    db_path = get_db_path(user_id)
-    
-    # Initialize if doesn't exist
-    if not os.path.exists(db_path):
-        return create_engine(
-            f"sqlite:///{db_path}",
-            connect_args={"check_same_thread": False},
-            pool_pre_ping=True
-        )
-    
-    engine = create_engine(
-        f"sqlite:///{db_path}",
-        connect_args={"check_same_thread": False},
-        pool_pre_ping=True
-    )
-    
-    _engines[user_id] = engine
-    return engine
-
-
-def get_session(user_id: str) -> Session:
-    """Get or create session for user"""
-    if user_id in _sessions:
-        return _sessions[user_id]
-    
-    engine = get_engine(user_id)
-    
-    # Ensure tables exist
-    Base.metadata.create_all(bind=engine)
-    
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    session = SessionLocal()
-    
-    _sessions[user_id] = session
-    return session
-
-
-def get_db(user_id: str = Header(..., alias="X-User-ID")):
-    """
-    FastAPI dependency for database session
-    Extracts user_id from X-User-ID header
-    """
-    from utils import validate_user_id
-    
-    if not validate_user_id(user_id):
-        raise HTTPException(status_code=400, detail="Invalid user ID format")
-    
-    db_path = get_db_path(user_id)
-    if not os.path.exists(db_path):
-        # Auto-initialize if doesn't exist
-        init_user_db(user_id)
-    
-    session = get_session(user_id)
-    
-    try:
-        yield session
-    except Exception as e:
-        session.rollback()
-        raise
-    finally:
-        # Don't close - keep session alive
-        pass
-
-
-def get_db_info(user_id: str) -> dict:
-    """
-    Get database information and statistics
-    """
-    db_path = get_db_path(user_id)
-    
-    if not os.path.exists(db_path):
-        raise HTTPException(status_code=404, detail="User database not found")
-    
-    # File size
-    file_size = os.path.getsize(db_path)
-    
-    # Get counts
-    session = get_session(user_id)
-    
-    contacts_count = session.query(Contact).count()
-    companies_count = session.query(Company).count()
-    deals_count = session.query(Deal).count()
-    activities_count = session.query(Activity).count()
-    notes_count = session.query(Note).count()
-    
-    return {
-        "user_id": user_id,
-        "database_path": db_path,
-        "file_size_bytes": file_size,
-        "file_size_mb": round(file_size / (1024 * 1024), 2),
-        "record_counts": {
-            "contacts": contacts_count,
-            "companies": companies_count,
-            "deals": deals_count,
-            "activities": activities_count,
-            "notes": notes_count,
-            "total": contacts_count + companies_count + deals_count + activities_count + notes_count
-        },
-        "created_at": datetime.fromtimestamp(os.path.getctime(db_path)).isoformat()
-    }
-
-
-def close_all():
-    """Close all sessions and engines (cleanup)"""
-    for session in _sessions.values():
-        session.close()
-    _sessions.clear()
-    
-    for engine in _engines.values():
-        engine.dispose()
-    _engines.clear()
-
-
-def delete_user_db(user_id: str) -> bool:
-    """Delete user's database file"""
-    # Close session/engine if exists
-    if user_id in _sessions:
-        _sessions[user_id].close()
-        del _sessions[user_id]
-    
-    if user_id in _engines:
-        _engines[user_id].dispose()
-        del _engines[user_id]
-    
-    db_path = get_db_path(user_id)
-    
-    if os.path.exists(db_path):
-        os.remove(db_path)
-        return True
-    
-    return False
-
-
-def list_all_users() -> list:
-    """List all user database IDs"""
-    user_ids = []
-    
-    for filename in os.listdir(DB_DIR):
-        if filename.startswith("crm_") and filename.endswith(".db"):
-            user_id = filename[4:-3]
-            user_ids.append(user_id)
-    
-    return user_ids
-
-
-def backup_user_db(user_id: str, backup_path: str):
-    """Create backup of user database"""
-    import shutil
-    
-    db_path = get_db_path(user_id)
-    
-    if not os.path.exists(db_path):
-        raise FileNotFoundError(f"Database for user {user_id} not found")
-    
-    shutil.copy2(db_path, backup_path)
-    return backup_path
-
-
-def restore_user_db(user_id: str, backup_path: str):
-    """Restore user database from backup"""
-    import shutil
-    
-    if not os.path.exists(backup_path):
-        raise FileNotFoundError(f"Backup file {backup_path} not found")
-    
-    # Close existing connections
-    if user_id in _sessions:
-        _sessions[user_id].close()
-        del _sessions[user_id]
-    
-    if user_id in _engines:
-        _engines[user_id].dispose()
-        del _engines[user_id]
-    
-    db_path = get_db_path(user_id)
-    shutil.copy2(backup_path, db_path)
-    
-    return db_path
-
-
-# ══════════════════════════════════════════════════════════════
-# QUERY HELPERS
-# ══════════════════════════════════════════════════════════════
-
-def get_contact_with_company(session: Session, contact_id: int):
-    """Get contact with company name"""
-    contact = session.query(Contact).filter(Contact.id == contact_id).first()
-    if not contact:
-        return None
-    
-    result = {
-        **{c.name: getattr(contact, c.name) for c in Contact.__table__.columns},
-        "full_name": f"{contact.first_name} {contact.last_name}",
-        "company_name": None
-    }
-    
-    if contact.company_id:
-        company = session.query(Company).filter(Company.id == contact.company_id).first()
-        if company:
-            result["company_name"] = company.name
-    
-    return result
-
-
-def get_company_with_counts(session: Session, company_id: int):
-    """Get company with contact/deal counts"""
-    company = session.query(Company).filter(Company.id == company_id).first()
-    if not company:
-        return None
-    
-    contact_count = session.query(Contact).filter(Contact.company_id == company_id).count()
-    deal_count = session.query(Deal).filter(Deal.company_id == company_id).count()
-    
-    result = {
-        **{c.name: getattr(company, c.name) for c in Company.__table__.columns},
-        "contact_count": contact_count,
-        "deal_count": deal_count
-    }
-    
+"""
+Database Manager - Per-user SQLite with SQLAlchemy models
+Each user gets isolated database with full CRM schema
+"""
+
+from sqlalchemy import create_engine, event, func, insert, select, text, Column, ForeignKey, Index, Integer, MetaData, String, DateTime, Text, Date, JSON
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.orm import sessionmaker, scoped_session, relationship, raiseload, Session
+from collections import OrderedDict
+from datetime import datetime
+from fastapi import Header, HTTPException
+import asyncio
+import os
+import threading
+
+# ══════════════════════════════════════════════════════════════
+# CONFIGURATION
+# ══════════════════════════════════════════════════════════════
+
+DB_DIR = os.path.join(os.path.dirname(__file__), "user_databases")
+os.makedirs(DB_DIR, exist_ok=True)
+
+Base = declarative_base()
+
+# Max users kept hot in the engine/session caches; each cached engine
+# holds a connection pool and open file descriptors
+MAX_CACHED_USERS = 128
+
+# Outside prod, force every ORM select to an explicit load plan so an
+# accidental lazy load (an N+1 regression) raises instead of silently
+# querying. Relationships already declare lazy="raise"; this extends the
+# guard to options-based loads. Opt out per statement with
+# .execution_options(allow_lazy=True).
+CRM_ENV = os.environ.get("CRM_ENV", "dev")
+
+if CRM_ENV != "prod":
+    @event.listens_for(Session, "do_orm_execute")
+    def _raiseload_guard(execute_state):
+        if (
+            execute_state.is_select
+            and not execute_state.is_column_load
+            and not execute_state.is_relationship_load
+            and not execute_state.execution_options.get("allow_lazy", False)
+        ):
+            execute_state.statement = execute_state.statement.options(raiseload("*"))
+
+
+class _LRUCache(OrderedDict):
+    """Bounded LRU mapping that cleans up evicted values"""
+
+    def __init__(self, maxsize, on_evict):
+        super().__init__()
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        # Overwriting a key must clean up the displaced value just
+        # like size-based eviction, or the old engine leaks its pool
+        if key in self:
+            displaced = super().__getitem__(key)
+            if displaced is not value:
+                self.on_evict(displaced)
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            _, evicted = self.popitem(last=False)
+            self.on_evict(evicted)
+
+
+# Guards the caches below: concurrent requests for an uncached user
+# must not each build (and leak) their own engine
+_cache_lock = threading.RLock()
+
+# Session cache
+_sessions = _LRUCache(MAX_CACHED_USERS, lambda factory: factory.remove())
+_engines = _LRUCache(MAX_CACHED_USERS, lambda engine: engine.dispose())
+
+# Read-only counterparts for helpers that never write
+_ro_sessions = _LRUCache(MAX_CACHED_USERS, lambda factory: factory.remove())
+_ro_engines = _LRUCache(MAX_CACHED_USERS, lambda engine: engine.dispose())
+
+# ══════════════════════════════════════════════════════════════
+# MODELS
+# ══════════════════════════════════════════════════════════════
+
+class Contact(Base):
+    """Contact/Lead entity"""
+    __tablename__ = "contacts"
+    __table_args__ = (
+        Index("ix_contacts_company_status", "company_id", "status"),
+        Index("ix_contacts_lead_sort", "status", "lead_score"),
+        Index("ix_contacts_status_created", "status", "created_at"),
+        Index("ix_contacts_company_created", "company_id", "created_at"),
+        Index("ix_contacts_score_created", "lead_score", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    first_name = Column(String(100), nullable=False, index=True)
+    last_name = Column(String(100), nullable=False, index=True)
+    email = Column(String(255), unique=True, nullable=False, index=True)
+    phone = Column(String(50))
+    mobile = Column(String(50))
+    title = Column(String(100))
+    department = Column(String(100))
+    company_id = Column(Integer, ForeignKey("companies.id"), index=True)
+    linkedin_url = Column(String(255))
+    twitter_handle = Column(String(100))
+    street = Column(String(255))
+    city = Column(String(100))
+    state = Column(String(100))
+    country = Column(String(100))
+    postal_code = Column(String(20))
+    status = Column(String(50), default="lead", index=True)
+    lead_source = Column(String(100))
+    lead_score = Column(Integer, default=0)
+    # JSON1 column: tag filters can use json_each() server-side instead
+    # of LIKE scans over a serialized string
+    tags = Column(JSON)
+    notes = Column(Text)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), index=True)
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
+
+    # lazy="raise" turns accidental lazy loads (N+1) into errors;
+    # query sites must opt in with selectinload/joinedload
+    company = relationship("Company", back_populates="contacts", lazy="raise")
+
+    @hybrid_property
+    def full_name(self):
+        return self.first_name + " " + self.last_name
+
+    @full_name.expression
+    def full_name(cls):
+        return cls.first_name + " " + cls.last_name
+
+
+class Company(Base):
+    """Company/Account entity"""
+    __tablename__ = "companies"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(255), nullable=False, index=True)
+    website = Column(String(255))
+    industry = Column(String(100), index=True)
+    company_size = Column(String(50))
+    # Monetary amount stored as integer cents: exact sums, faster
+    # VDBE aggregation and tighter index keys than REAL
+    annual_revenue_cents = Column(Integer)
+    phone = Column(String(50))
+    email = Column(String(255))
+    street = Column(String(255))
+    city = Column(String(100))
+    state = Column(String(100))
+    country = Column(String(100))
+    postal_code = Column(String(20))
+    company_type = Column(String(50), default="prospect", index=True)
+    priority = Column(String(20), default="medium")
+    description = Column(Text)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), index=True)
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
+
+    contacts = relationship(
+        "Contact", back_populates="company", lazy="raise", passive_deletes=True
+    )
+
+    @hybrid_property
+    def annual_revenue(self):
+        if self.annual_revenue_cents is None:
+            return None
+        return self.annual_revenue_cents / 100.0
+
+    @annual_revenue.setter
+    def annual_revenue(self, amount):
+        self.annual_revenue_cents = (
+            int(round(amount * 100)) if amount is not None else None
+        )
+
+    @annual_revenue.expression
+    def annual_revenue(cls):
+        return cls.annual_revenue_cents / 100.0
+
+
+class Deal(Base):
+    """Deal/Opportunity entity"""
+    __tablename__ = "deals"
+    __table_args__ = (
+        Index("ix_deals_company_stage", "company_id", "stage"),
+        Index("ix_deals_status_created", "status", "created_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    title = Column(String(255), nullable=False)
+    value_cents = Column(Integer, nullable=False)
+    stage = Column(String(50), default="qualification", index=True)
+    status = Column(String(20), default="open", index=True)
+    probability = Column(Integer, default=10)
+    expected_close_date = Column(Date)
+    actual_close_date = Column(Date)
+    contact_id = Column(Integer, ForeignKey("contacts.id"), index=True)
+    company_id = Column(Integer, ForeignKey("companies.id"), index=True)
+    description = Column(Text)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), index=True)
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
+
+    contact = relationship("Contact", lazy="raise")
+    company = relationship("Company", lazy="raise")
+
+    @hybrid_property
+    def value(self):
+        if self.value_cents is None:
+            return None
+        return self.value_cents / 100.0
+
+    @value.setter
+    def value(self, amount):
+        self.value_cents = int(round(amount * 100)) if amount is not None else None
+
+    @value.expression
+    def value(cls):
+        return cls.value_cents / 100.0
+
+    @hybrid_property
+    def weighted_value(self):
+        return self.value * self.probability / 100.0
+
+    @weighted_value.expression
+    def weighted_value(cls):
+        return cls.value_cents * cls.probability / 10000.0
+
+
+class Activity(Base):
+    """Activity entity (calls, meetings, tasks, etc.)"""
+    __tablename__ = "activities"
+    __table_args__ = (
+        Index("ix_activities_company_date", "company_id", "activity_date"),
+        Index("ix_activities_deal_date", "deal_id", "activity_date"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    activity_type = Column(String(50), nullable=False, index=True)
+    subject = Column(String(255), nullable=False)
+    description = Column(Text)
+    activity_date = Column(DateTime, nullable=False, index=True)
+    duration_minutes = Column(Integer)
+    contact_id = Column(Integer, ForeignKey("contacts.id"), index=True)
+    company_id = Column(Integer, ForeignKey("companies.id"), index=True)
+    deal_id = Column(Integer, ForeignKey("deals.id"), index=True)
+    status = Column(String(50), default="pending", index=True)
+    priority = Column(String(20), default="medium")
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), index=True)
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
+
+
+class Note(Base):
+    """Note entity for attachments to contacts/companies/deals"""
+    __tablename__ = "notes"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    content = Column(Text, nullable=False)
+    contact_id = Column(Integer, ForeignKey("contacts.id"), index=True)
+    company_id = Column(Integer, ForeignKey("companies.id"), index=True)
+    deal_id = Column(Integer, ForeignKey("deals.id"), index=True)
+    created_at = Column(DateTime, default=func.now(), server_default=func.now(), index=True)
+
+
+# Column-name tuples cached at import time so serialization helpers
+# don't re-walk Table metadata on every call
+_CONTACT_COLS = tuple(c.name for c in Contact.__table__.columns)
+_COMPANY_COLS = tuple(c.name for c in Company.__table__.columns)
+
+
+# ══════════════════════════════════════════════════════════════
+# DATABASE FUNCTIONS
+# ══════════════════════════════════════════════════════════════
+
+def get_db_path(user_id: str) -> str:
+    """Get database file path for user"""
+    return os.path.join(DB_DIR, f"crm_{user_id}.db")
+
+
+def _tune(dbapi_conn, _):
+    """
+    Apply performance PRAGMAs on each new raw connection
+    WAL lets readers run concurrently with the writer and moves
+    fsync cost from per-commit to checkpoints
+    """
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA journal_mode=WAL")
+    cur.execute("PRAGMA synchronous=NORMAL")
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA mmap_size=268435456")
+    cur.execute("PRAGMA cache_size=-65536")
+    cur.execute("PRAGMA busy_timeout=5000")
+    cur.close()
+
+
+def _create_tuned_engine(db_path: str):
+    """Create engine with tuned PRAGMAs attached (file-based DBs only)"""
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+        poolclass=QueuePool,
+        pool_size=5,
+        max_overflow=10,
+        pool_use_lifo=True,
+        pool_pre_ping=True,
+        pool_recycle=3600
+    )
+
+    # WAL only makes sense for file-backed databases
+    if db_path != ":memory:":
+        event.listen(engine, "connect", _tune)
+
+    return engine
+
+
+# Tables whose legacy float column was replaced by an integer-cents
+# column: (table, legacy column, cents column, backfill expression)
+_SCHEMA_UPGRADES = (
+    ("deals", "value", "value_cents",
+     "CAST(round(value * 100) AS INTEGER)"),
+    ("companies", "annual_revenue", "annual_revenue_cents",
+     "CAST(round(annual_revenue * 100) AS INTEGER)"),
+)
+
+
+def _rebuild_table(conn, table_name, old_cols, copy_exprs):
+    """
+    Copy-rename rebuild of a table onto the current model schema
+    ALTER TABLE can't drop a NOT NULL legacy column or change its
+    constraints, so build the new table beside the old one, copy the
+    rows across and swap names. The old table's triggers go down with
+    it; _ensure_counters/_ensure_fts recreate them afterwards
+    """
+    model_table = Base.metadata.tables[table_name]
+    tmp_name = f"{table_name}_new"
+
+    # Index names are database-global, so the old table's indexes have
+    # to go before the model DDL can recreate them on the new table
+    for (index_name,) in conn.exec_driver_sql(
+        "SELECT name FROM sqlite_master "
+        "WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+        (table_name,),
+    ).fetchall():
+        conn.exec_driver_sql(f'DROP INDEX "{index_name}"')
+
+    # Clone into a scratch MetaData under the temp name; referred
+    # tables come along too so foreign keys resolve, but only the
+    # temp table itself is created
+    tmp_meta = MetaData()
+    for fk in model_table.foreign_keys:
+        if fk.column.table.name not in tmp_meta.tables:
+            fk.column.table.to_metadata(tmp_meta)
+    model_table.to_metadata(tmp_meta, name=tmp_name).create(bind=conn)
+
+    dest_cols = []
+    select_exprs = []
+    for column in model_table.columns:
+        if column.name in copy_exprs:
+            dest_cols.append(column.name)
+            select_exprs.append(copy_exprs[column.name])
+        elif column.name in old_cols:
+            dest_cols.append(column.name)
+            select_exprs.append(column.name)
+    conn.exec_driver_sql(
+        f"INSERT INTO {tmp_name} ({', '.join(dest_cols)}) "
+        f"SELECT {', '.join(select_exprs)} FROM {table_name}"
+    )
+
+    # Drop-then-rename (instead of renaming the old table aside) keeps
+    # SQLite from rewriting other tables' foreign-key references
+    conn.exec_driver_sql(f"DROP TABLE {table_name}")
+    conn.exec_driver_sql(f"ALTER TABLE {tmp_name} RENAME TO {table_name}")
+
+
+def _ensure_schema(engine):
+    """
+    Upgrade pre-existing databases in place
+    create_all only creates missing tables, never missing columns, so
+    tables created before the integer-cents migration get rebuilt on
+    the current schema here (no-op once applied)
+    """
+    with engine.begin() as conn:
+        for table, legacy, column, backfill in _SCHEMA_UPGRADES:
+            cols = {
+                row[1]
+                for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")
+            }
+            if legacy not in cols:
+                continue
+            # A partially upgraded table (cents column bolted on next
+            # to the legacy one) may hold newer cents values; keep them
+            expr = f"COALESCE({column}, {backfill})" if column in cols else backfill
+            _rebuild_table(conn, table, cols, {column: expr})
+
+            # The rebuild took this table's FTS sync triggers with it;
+            # drop the FTS table so _ensure_fts recreates and reseeds
+            for fts, content_table, _ in _FTS_TABLES:
+                if content_table == table:
+                    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {fts}")
+
+        # Tags written before the column became JSON-typed are plain
+        # text ('vip, hot'); the JSON result processor json.loads-es
+        # every non-null value, so re-encode anything that isn't
+        # already a JSON string (two passes: json_type errors out on
+        # malformed input, so it must only see valid JSON)
+        conn.exec_driver_sql(
+            "UPDATE contacts SET tags = json_quote(tags) "
+            "WHERE tags IS NOT NULL AND NOT json_valid(tags)"
+        )
+        conn.exec_driver_sql(
+            "UPDATE contacts SET tags = json_quote(tags) "
+            "WHERE tags IS NOT NULL AND json_valid(tags) "
+            "AND json_type(tags) NOT IN ('text', 'null')"
+        )
+
+        # Legacy tables have no DDL DEFAULT on the timestamp columns,
+        # and inserts briefly relied on one, so upgraded databases may
+        # hold rows with NULL timestamps that response models reject
+        for table in ("contacts", "companies", "deals", "activities"):
+            conn.exec_driver_sql(
+                f"UPDATE {table} SET created_at = CURRENT_TIMESTAMP "
+                f"WHERE created_at IS NULL"
+            )
+            conn.exec_driver_sql(
+                f"UPDATE {table} SET updated_at = created_at "
+                f"WHERE updated_at IS NULL"
+            )
+        conn.exec_driver_sql(
+            "UPDATE notes SET created_at = CURRENT_TIMESTAMP "
+            "WHERE created_at IS NULL"
+        )
+
+
+# Tables tracked by the counters meta-table
+_COUNTED_TABLES = ("contacts", "companies", "deals", "activities", "notes")
+
+
+def _ensure_counters(engine):
+    """
+    Create the counters meta-table and per-table triggers
+    COUNT(*) is O(n) in SQLite; trigger-maintained counters make
+    get_db_info an O(1) lookup per table
+    """
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE IF NOT EXISTS counters "
+            "(name TEXT PRIMARY KEY, n INTEGER NOT NULL DEFAULT 0)"
+        )
+
+        for table in _COUNTED_TABLES:
+            # Seed from the current row count (no-op once present)
+            conn.exec_driver_sql(
+                f"INSERT OR IGNORE INTO counters (name, n) "
+                f"VALUES ('{table}', (SELECT COUNT(*) FROM {table}))"
+            )
+            conn.exec_driver_sql(
+                f"CREATE TRIGGER IF NOT EXISTS trg_{table}_count_ins "
+                f"AFTER INSERT ON {table} BEGIN "
+                f"UPDATE counters SET n = n + 1 WHERE name = '{table}'; END"
+            )
+            conn.exec_driver_sql(
+                f"CREATE TRIGGER IF NOT EXISTS trg_{table}_count_del "
+                f"AFTER DELETE ON {table} BEGIN "
+                f"UPDATE counters SET n = n - 1 WHERE name = '{table}'; END"
+            )
+
+
+# FTS5 shadow tables backing the search boxes: (fts table, content
+# table, indexed columns)
+_FTS_TABLES = (
+    ("contact_fts", "contacts", ("first_name", "last_name", "email", "title")),
+    ("company_fts", "companies", ("name",)),
+)
+
+
+def _ensure_fts(engine):
+    """
+    Create FTS5 virtual tables and sync triggers for search
+    Leading-wildcard LIKE can't use an index, so every search was a
+    full table scan; MATCH against the FTS index is O(matches)
+    """
+    with engine.begin() as conn:
+        for fts, table, columns in _FTS_TABLES:
+            present = conn.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (fts,),
+            ).fetchone()
+            if present:
+                continue
+
+            cols = ", ".join(columns)
+            new_vals = ", ".join(f"new.{c}" for c in columns)
+            old_vals = ", ".join(f"old.{c}" for c in columns)
+
+            conn.exec_driver_sql(
+                f"CREATE VIRTUAL TABLE {fts} USING fts5 "
+                f"({cols}, content='{table}', content_rowid='id')"
+            )
+            conn.exec_driver_sql(
+                f"CREATE TRIGGER trg_{table}_fts_ins AFTER INSERT ON {table} BEGIN "
+                f"INSERT INTO {fts} (rowid, {cols}) VALUES (new.id, {new_vals}); END"
+            )
+            conn.exec_driver_sql(
+                f"CREATE TRIGGER trg_{table}_fts_del AFTER DELETE ON {table} BEGIN "
+                f"INSERT INTO {fts} ({fts}, rowid, {cols}) "
+                f"VALUES ('delete', old.id, {old_vals}); END"
+            )
+            conn.exec_driver_sql(
+                f"CREATE TRIGGER trg_{table}_fts_upd AFTER UPDATE ON {table} BEGIN "
+                f"INSERT INTO {fts} ({fts}, rowid, {cols}) "
+                f"VALUES ('delete', old.id, {old_vals}); "
+                f"INSERT INTO {fts} (rowid, {cols}) VALUES (new.id, {new_vals}); END"
+            )
+            # Index any rows that predate the FTS table
+            conn.exec_driver_sql(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+
+
+def _tune_ro(dbapi_conn, _):
+    """Read-only connection PRAGMAs (journal mode can't be changed here)"""
+    cur = dbapi_conn.cursor()
+    cur.execute("PRAGMA temp_store=MEMORY")
+    cur.execute("PRAGMA mmap_size=268435456")
+    cur.execute("PRAGMA cache_size=-65536")
+    cur.execute("PRAGMA busy_timeout=5000")
+    cur.close()
+
+
+def get_ro_engine(user_id: str):
+    """
+    Get or create a read-only engine for user
+    mode=ro connections never take the write lock, so read paths
+    stay out of WAL writer coordination entirely
+    """
+    with _cache_lock:
+        if user_id in _ro_engines:
+            return _ro_engines[user_id]
+
+        db_path = get_db_path(user_id)
+
+        engine = create_engine(
+            f"sqlite:///file:{db_path}?mode=ro&uri=true",
+            connect_args={"check_same_thread": False},
+            poolclass=QueuePool,
+            pool_size=5,
+            max_overflow=10,
+            pool_use_lifo=True,
+            pool_pre_ping=True,
+            pool_recycle=3600
+        )
+        event.listen(engine, "connect", _tune_ro)
+
+        _ro_engines[user_id] = engine
+        return engine
+
+
+def _ro_session_factory(user_id: str) -> scoped_session:
+    """Get or create the read-only scoped session factory for user"""
+    with _cache_lock:
+        if user_id not in _ro_sessions:
+            _ro_sessions[user_id] = scoped_session(
+                sessionmaker(autocommit=False, autoflush=False, bind=get_ro_engine(user_id)),
+                scopefunc=_session_scope
+            )
+
+        return _ro_sessions[user_id]
+
+
+def get_ro_session(user_id: str) -> Session:
+    """
+    Get or create a read-only session for user
+    Callers must factory.remove() (or close()) when done, or the
+    connection stays checked out of the read-only pool
+    """
+    return _ro_session_factory(user_id)()
+
+
+def init_user_db(user_id: str) -> str:
+    """
+    Initialize new SQLite database for user
+    Creates all tables and returns path
+    """
+    db_path = get_db_path(user_id)
+
+    # The whole init runs under the cache lock: get_engine caches
+    # there anyway (so concurrent first requests share one engine
+    # instead of leaking an overwritten one), and create_all's
+    # check-then-create races with itself otherwise
+    with _cache_lock:
+        engine = get_engine(user_id)
+
+        # Create all tables
+        Base.metadata.create_all(bind=engine)
+        _ensure_schema(engine)
+        _ensure_counters(engine)
+        _ensure_fts(engine)
+
+        # Populate sqlite_stat1 so the planner picks the composite
+        # indexes
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+
+    return db_path
+
+
+def get_engine(user_id: str):
+    """Get or create engine for user"""
+    with _cache_lock:
+        if user_id in _engines:
+            return _engines[user_id]
+
+        engine = _create_tuned_engine(get_db_path(user_id))
+
+        _engines[user_id] = engine
+        return engine
+
+
+def _session_scope():
+    """
+    Scope key for session registries: the current asyncio task when
+    running inside an event loop, the current thread otherwise.
+    Sessions are not safe to share across concurrent tasks/threads
+    """
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+
+    if task is not None:
+        return id(task)
+
+    return threading.get_ident()
+
+
+def _get_session_factory(user_id: str) -> scoped_session:
+    """Get or create the scoped session factory for user"""
+    with _cache_lock:
+        if user_id in _sessions:
+            return _sessions[user_id]
+
+        engine = get_engine(user_id)
+
+        # Ensure tables exist
+        Base.metadata.create_all(bind=engine)
+        _ensure_schema(engine)
+        _ensure_counters(engine)
+        _ensure_fts(engine)
+
+        factory = scoped_session(
+            sessionmaker(autocommit=False, autoflush=False, bind=engine),
+            scopefunc=_session_scope
+        )
+
+        _sessions[user_id] = factory
+        return factory
+
+
+def get_session(user_id: str) -> Session:
+    """Get or create session for user"""
+    return _get_session_factory(user_id)()
+
+
+def get_db(user_id: str = Header(..., alias="X-User-ID")):
+    """
+    FastAPI dependency for database session
+    Extracts user_id from X-User-ID header
+    """
+    from utils import validate_user_id
+    
+    if not validate_user_id(user_id):
+        raise HTTPException(status_code=400, detail="Invalid user ID format")
+
+    # Only stat the filesystem while the user isn't cached yet; cached
+    # users reuse their engine/pool without touching the kernel. The
+    # check-and-init runs under the cache lock so concurrent first
+    # requests don't both initialize (the RLock makes the nested
+    # init_user_db -> get_engine acquisition safe)
+    if user_id not in _sessions:
+        with _cache_lock:
+            if user_id not in _sessions and not os.path.exists(get_db_path(user_id)):
+                # Auto-initialize if doesn't exist
+                init_user_db(user_id)
+
+    factory = _get_session_factory(user_id)
+    session = factory()
+
+    try:
+        yield session
+    except Exception as e:
+        session.rollback()
+        raise
+    finally:
+        # Return session to the registry; engine/pool stay cached
+        factory.remove()
+
+
+def get_db_info(user_id: str) -> dict:
+    """
+    Get database information and statistics
+    """
+    db_path = get_db_path(user_id)
+
+    # One stat call covers existence, size and ctime
+    try:
+        st = os.stat(db_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="User database not found")
+
+    file_size = st.st_size
+
+    # Make sure schema + counters exist (no-op once cached), then read
+    # through the read-only engine: this endpoint never writes
+    _get_session_factory(user_id)
+    ro_factory = _ro_session_factory(user_id)
+    session = ro_factory()
+
+    try:
+        counts = dict(
+            session.execute(text("SELECT name, n FROM counters")).all()
+        )
+    finally:
+        # Return the connection to the read-only pool (mirrors get_db);
+        # the registry is scoped per task, so a leaked session would
+        # never be reused or cleaned up
+        ro_factory.remove()
+    contacts_count = counts.get("contacts", 0)
+    companies_count = counts.get("companies", 0)
+    deals_count = counts.get("deals", 0)
+    activities_count = counts.get("activities", 0)
+    notes_count = counts.get("notes", 0)
+
+    return {
+        "user_id": user_id,
+        "database_path": db_path,
+        "file_size_bytes": file_size,
+        "file_size_mb": round(file_size / (1024 * 1024), 2),
+        "record_counts": {
+            "contacts": contacts_count,
+            "companies": companies_count,
+            "deals": deals_count,
+            "activities": activities_count,
+            "notes": notes_count,
+            "total": sum(counts.get(t, 0) for t in _COUNTED_TABLES)
+        },
+        "created_at": datetime.fromtimestamp(st.st_ctime).isoformat()
+    }
+
+
+def close_all():
+    """Close all sessions and engines (cleanup)"""
+    with _cache_lock:
+        for cache in (_sessions, _ro_sessions):
+            for factory in cache.values():
+                factory.remove()
+            cache.clear()
+
+        for cache in (_engines, _ro_engines):
+            for engine in cache.values():
+                engine.dispose()
+            cache.clear()
+
+
+def _evict_user(user_id: str):
+    """Drop any cached sessions/engines (read-write and read-only) for user"""
+    with _cache_lock:
+        for cache in (_sessions, _ro_sessions):
+            if user_id in cache:
+                cache[user_id].remove()
+                del cache[user_id]
+
+        for cache in (_engines, _ro_engines):
+            if user_id in cache:
+                cache[user_id].dispose()
+                del cache[user_id]
+
+
+def _remove_sidecars(db_path: str):
+    """
+    Remove WAL/SHM sidecar files next to a database file
+    A stale -wal left beside a deleted or swapped-in database would be
+    replayed into whatever file takes that name next
+    """
+    for suffix in ("-wal", "-shm"):
+        try:
+            os.remove(db_path + suffix)
+        except FileNotFoundError:
+            pass
+
+
+def delete_user_db(user_id: str) -> bool:
+    """Delete user's database file"""
+    # Close session/engine if exists
+    _evict_user(user_id)
+
+    db_path = get_db_path(user_id)
+    _remove_sidecars(db_path)
+
+    if os.path.exists(db_path):
+        os.remove(db_path)
+        return True
+
+    return False
+
+
+def list_all_users() -> list:
+    """List all user database IDs"""
+    with os.scandir(DB_DIR) as entries:
+        return [
+            entry.name[4:-3]
+            for entry in entries
+            if entry.name.startswith("crm_")
+            and entry.name.endswith(".db")
+            and entry.is_file()
+        ]
+
+
+def backup_user_db(user_id: str, backup_path: str):
+    """Create backup of user database"""
+    import sqlite3
+
+    db_path = get_db_path(user_id)
+
+    if not os.path.exists(db_path):
+        raise FileNotFoundError(f"Database for user {user_id} not found")
+
+    # SQLite's online backup API copies pages under a read transaction,
+    # so the snapshot stays consistent even while another connection
+    # writes (a plain file copy can capture a torn WAL + main file)
+    src = sqlite3.connect(db_path)
+    dst = sqlite3.connect(backup_path)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
+
+    return backup_path
+
+
+def replace_user_db(user_id: str, new_db_path: str) -> str:
+    """
+    Atomically swap a fully-written database file into place
+    Cached engines are evicted first; os.replace is atomic so readers
+    see either the old or the new file, never a partial write
+    """
+    db_path = get_db_path(user_id)
+
+    _evict_user(user_id)
+    # Drop the old file's sidecars first so its un-checkpointed WAL
+    # can't be replayed into the incoming database
+    _remove_sidecars(db_path)
+    os.replace(new_db_path, db_path)
+    # The integrity-check connection may have left sidecars next to
+    # the temp upload; they're orphans once the file moves
+    _remove_sidecars(new_db_path)
+
+    return db_path
+
+
+def restore_user_db(user_id: str, backup_path: str):
+    """Restore user database from backup"""
+    import shutil
+    
+    if not os.path.exists(backup_path):
+        raise FileNotFoundError(f"Backup file {backup_path} not found")
+    
+    # Close existing connections
+    _evict_user(user_id)
+
+    db_path = get_db_path(user_id)
+    _remove_sidecars(db_path)
+    shutil.copy2(backup_path, db_path)
+
+    return db_path
+
+
+# ══════════════════════════════════════════════════════════════
+# QUERY HELPERS
+# ══════════════════════════════════════════════════════════════
+
+def export_table(session: Session, model) -> list:
+    """
+    Materialize every row of a table as plain dicts for export
+    Selects table columns directly so rows come back as lightweight
+    mappings instead of tracked ORM instances with per-attribute
+    descriptor access
+    """
+    result = session.execute(select(model.__table__))
+    return [dict(row) for row in result.mappings()]
+
+
+def bulk_insert(session: Session, model, rows: list):
+    """
+    Insert many rows (list of dicts) in a single transaction
+    One commit means one WAL sync for the whole batch instead of
+    one per row - use this for CSV imports
+    """
+    if not rows:
+        return 0
+
+    session.execute(insert(model), rows)
+    session.commit()
+
+    return len(rows)
+
+def get_contact_with_company(session: Session, contact_id: int):
+    """Get contact with company name (single outer-joined query)"""
+    row = session.execute(
+        select(Contact, Company.name)
+        .outerjoin(Company, Company.id == Contact.company_id)
+        .where(Contact.id == contact_id)
+    ).first()
+    if not row:
+        return None
+
+    contact, company_name = row
+
+    result = {
+        **{name: getattr(contact, name) for name in _CONTACT_COLS},
+        "full_name": f"{contact.first_name} {contact.last_name}",
+        "company_name": company_name
+    }
+
+    return result
+
+
+def get_company_with_counts(session: Session, company_id: int):
+    """Get company with contact/deal counts (single aggregate query)"""
+    contact_sq = select(func.count(Contact.id))\
+        .where(Contact.company_id == company_id)\
+        .scalar_subquery()
+    deal_sq = select(func.count(Deal.id))\
+        .where(Deal.company_id == company_id)\
+        .scalar_subquery()
+
+    row = session.execute(
+        select(Company, contact_sq, deal_sq)
+        .where(Company.id == company_id)
+    ).first()
+    if not row:
+        return None
+
+    company, contact_count, deal_count = row
+
+    result = {
+        **{name: getattr(company, name) for name in _COMPANY_COLS},
+        "annual_revenue": company.annual_revenue,
+        "contact_count": contact_count,
+        "deal_count": deal_count
+    }
+    result.pop("annual_revenue_cents", None)
+
     return result
\ No newline at end of file
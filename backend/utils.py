@@ -1,484 +1,804 @@
-"""
-Utility Functions - Helper functions for CRM operations
-"""
-
-import uuid
-import hashlib
-import re
-import csv
-import io
-from datetime import datetime, timedelta, date
-from typing import List, Dict, Optional
-
-# ══════════════════════════════════════════════════════════════
-# USER ID MANAGEMENT
-# ══════════════════════════════════════════════════════════════
-
-def generate_user_id() -> str:
-    """Generate unique user ID (UUID4)"""
-    return str(uuid.uuid4())
-
-
-def validate_user_id(user_id: str) -> bool:
-    """Validate user ID format"""
-    try:
-        uuid.UUID(user_id, version=4)
-        return True
-    except (ValueError, AttributeError, TypeError):
-        return False
-
-
-def hash_user_id(user_id: str) -> str:
-    """Create SHA256 hash of user ID (for filenames)"""
-    return hashlib.sha256(user_id.encode()).hexdigest()[:16]
-
-
-# ══════════════════════════════════════════════════════════════
-# VALIDATION
-# ══════════════════════════════════════════════════════════════
-
-def validate_email(email: str) -> bool:
-    """Validate email format"""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
-
-
-def validate_phone(phone: str) -> bool:
-    """Validate phone number"""
-    cleaned = re.sub(r'[\s\-\(\)\+]', '', phone)
-    return cleaned.isdigit() and 7 <= len(cleaned) <= 15
-
-
-def validate_url(url: str) -> bool:
-    """Validate URL format"""
-    pattern = r'^https?://[^\s/$.?#].[^\s]*$'
-    return bool(re.match(pattern, url, re.IGNORECASE))
-
-
-# ══════════════════════════════════════════════════════════════
-# FORMATTING
-# ══════════════════════════════════════════════════════════════
-
-def format_currency(amount: float, currency: str = "USD") -> str:
-    """Format currency for display"""
-    symbols = {
-        "USD": "$",
-        "EUR": "€",
-        "GBP": "£",
-        "INR": "₹"
-    }
-    symbol = symbols.get(currency, currency + " ")
-    return f"{symbol}{amount:,.2f}"
-
-
-def format_phone(phone: str, format_type: str = "US") -> str:
-    """Format phone number"""
-    digits = re.sub(r'\D', '', phone)
-    
-    if format_type == "US" and len(digits) == 10:
-        return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
-    elif format_type == "US" and len(digits) == 11 and digits[0] == '1':
-        return f"+1 ({digits[1:4]}) {digits[4:7]}-{digits[7:]}"
-    
-    return phone
-
-
-def format_percentage(value: float) -> str:
-    """Format as percentage"""
-    return f"{value:.1f}%"
-
-
-def truncate_text(text: str, max_length: int = 100) -> str:
-    """Truncate text with ellipsis"""
-    if len(text) <= max_length:
-        return text
-    return text[:max_length - 3] + "..."
-
-
-# ══════════════════════════════════════════════════════════════
-# DATE/TIME UTILITIES
-# ══════════════════════════════════════════════════════════════
-
-def format_date(dt: datetime, format_str: str = "%Y-%m-%d") -> str:
-    """Format datetime to string"""
-    return dt.strftime(format_str)
-
-
-def format_datetime(dt: datetime) -> str:
-    """Format datetime with time"""
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
-
-
-def parse_date(date_str: str) -> date:
-    """Parse ISO date string"""
-    return datetime.fromisoformat(date_str).date()
-
-
-def get_date_range(period: str) -> tuple:
-    """Get start and end dates for period"""
-    now = datetime.utcnow()
-    
-    ranges = {
-        "today": (
-            now.replace(hour=0, minute=0, second=0),
-            now.replace(hour=23, minute=59, second=59)
-        ),
-        "yesterday": (
-            (now - timedelta(days=1)).replace(hour=0, minute=0, second=0),
-            (now - timedelta(days=1)).replace(hour=23, minute=59, second=59)
-        ),
-        "this_week": (
-            now - timedelta(days=now.weekday()),
-            now
-        ),
-        "this_month": (
-            now.replace(day=1, hour=0, minute=0, second=0),
-            now
-        ),
-        "last_30_days": (
-            now - timedelta(days=30),
-            now
-        ),
-        "this_year": (
-            now.replace(month=1, day=1, hour=0, minute=0, second=0),
-            now
-        )
-    }
-    
-    return ranges.get(period, (now - timedelta(days=30), now))
-
-
-def days_until(target: date) -> int:
-    """Calculate days until target date"""
-    today = date.today()
-    delta = target - today
-    return delta.days
-
-
-def is_overdue(target: date) -> bool:
-    """Check if date is past"""
-    return target < date.today()
-
-
-def get_quarter(dt: datetime) -> int:
-    """Get fiscal quarter (1-4)"""
-    return (dt.month - 1) // 3 + 1
-
-
-# ══════════════════════════════════════════════════════════════
-# CRM-SPECIFIC CALCULATIONS
-# ══════════════════════════════════════════════════════════════
-
-def calculate_lead_score(contact_data: dict) -> int:
-    """
-    Calculate lead score (0-100) based on contact data
-    Higher score = better quality lead
-    """
-    score = 0
-    
-    # Company association
-    if contact_data.get('company_id'):
-        score += 20
-    
-    # Job title
-    if contact_data.get('title'):
-        score += 10
-        title_lower = contact_data['title'].lower()
-        if any(term in title_lower for term in ['ceo', 'cto', 'cfo', 'vp', 'director', 'head']):
-            score += 10
-        if any(term in title_lower for term in ['president', 'founder', 'owner']):
-            score += 15
-    
-    # Contact info
-    if contact_data.get('phone'):
-        score += 10
-    if contact_data.get('mobile'):
-        score += 5
-    
-    # Social presence
-    if contact_data.get('linkedin_url'):
-        score += 15
-    if contact_data.get('twitter_handle'):
-        score += 5
-    
-    # Complete address
-    if all(contact_data.get(f) for f in ['street', 'city', 'state', 'country']):
-        score += 10
-    
-    # Lead source quality
-    source = contact_data.get('lead_source', '').lower()
-    if source in ['referral', 'partner']:
-        score += 15
-    elif source in ['web', 'campaign', 'event']:
-        score += 5
-    
-    # Corporate email (not free)
-    email = contact_data.get('email', '')
-    if email and not any(d in email.lower() for d in ['gmail', 'yahoo', 'hotmail', 'outlook']):
-        score += 10
-    
-    return min(score, 100)
-
-
-def calculate_deal_weighted_value(value: float, probability: int) -> float:
-    """Calculate weighted deal value"""
-    return value * (probability / 100)
-
-
-def get_deal_stage_number(stage: str) -> int:
-    """Get stage number for sorting"""
-    stages = {
-        'qualification': 1,
-        'needs_analysis': 2,
-        'proposal': 3,
-        'negotiation': 4,
-        'closed_won': 5,
-        'closed_lost': 6
-    }
-    return stages.get(stage.lower(), 0)
-
-
-def calculate_pipeline_metrics(deals: List[dict]) -> dict:
-    """Calculate pipeline metrics"""
-    open_deals = [d for d in deals if d.get('status') == 'open']
-    
-    total_value = sum(d.get('value', 0) for d in open_deals)
-    weighted_value = sum(
-        calculate_deal_weighted_value(d.get('value', 0), d.get('probability', 0))
-        for d in open_deals
-    )
-    
-    won_deals = [d for d in deals if d.get('status') == 'won']
-    total_revenue = sum(d.get('value', 0) for d in won_deals)
-    
-    return {
-        'total_value': total_value,
-        'weighted_value': weighted_value,
-        'open_count': len(open_deals),
-        'total_revenue': total_revenue,
-        'won_count': len(won_deals)
-    }
-
-
-def get_activity_priority_number(priority: str) -> int:
-    """Get priority number for sorting"""
-    priorities = {
-        'low': 1,
-        'medium': 2,
-        'high': 3,
-        'critical': 4
-    }
-    return priorities.get(priority.lower(), 2)
-
-
-# ══════════════════════════════════════════════════════════════
-# STRING UTILITIES
-# ══════════════════════════════════════════════════════════════
-
-def clean_string(text: str) -> str:
-    """Clean and normalize string"""
-    if not text:
-        return ""
-    return " ".join(text.split()).strip()
-
-
-def slugify(text: str) -> str:
-    """Convert to URL-friendly slug"""
-    text = text.lower()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
-    return text.strip('-')
-
-
-def parse_tags(tags_str: Optional[str]) -> List[str]:
-    """Parse comma-separated tags"""
-    if not tags_str:
-        return []
-    return [t.strip() for t in tags_str.split(',') if t.strip()]
-
-
-def format_tags(tags_list: List[str]) -> str:
-    """Format tags to comma-separated string"""
-    return ', '.join(t.strip() for t in tags_list if t.strip())
-
-
-def extract_domain(email: str) -> str:
-    """Extract domain from email"""
-    if '@' in email:
-        return email.split('@')[1].lower()
-    return ""
-
-
-def get_initials(first_name: str, last_name: str) -> str:
-    """Get initials from name"""
-    return f"{first_name[0]}{last_name[0]}".upper() if first_name and last_name else ""
-
-
-# ══════════════════════════════════════════════════════════════
-# EXPORT/IMPORT
-# ══════════════════════════════════════════════════════════════
-
-def export_to_csv(records: List, fields: List[str]) -> str:
-    """Export records to CSV string"""
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=fields)
-    
-    writer.writeheader()
-    for record in records:
-        row = {}
-        for field in fields:
-            value = getattr(record, field, None)
-            if isinstance(value, datetime):
-                value = value.isoformat()
-            row[field] = value
-        writer.writerow(row)
-    
-    return output.getvalue()
-
-
-def parse_csv_row(row: dict, field_types: dict) -> dict:
-    """Parse CSV row with type conversion"""
-    parsed = {}
-    
-    for field, value in row.items():
-        if field not in field_types:
-            parsed[field] = value
-            continue
-        
-        field_type = field_types[field]
-        
-        try:
-            if field_type == 'int':
-                parsed[field] = int(value) if value else None
-            elif field_type == 'float':
-                parsed[field] = float(value) if value else None
-            elif field_type == 'bool':
-                parsed[field] = value.lower() in ['true', '1', 'yes'] if value else False
-            elif field_type == 'date':
-                parsed[field] = datetime.fromisoformat(value).date() if value else None
-            elif field_type == 'datetime':
-                parsed[field] = datetime.fromisoformat(value) if value else None
-            else:
-                parsed[field] = value
-        except (ValueError, TypeError):
-            parsed[field] = None
-    
-    return parsed
-
-
-def sanitize_filename(filename: str) -> str:
-    """Sanitize filename"""
-    filename = re.sub(r'[<>:"/\\|?*]', '', filename)
-    filename = filename.strip('. ')
-    return filename[:255] or 'untitled'
-
-
-# ══════════════════════════════════════════════════════════════
-# PAGINATION
-# ══════════════════════════════════════════════════════════════
-
-def calculate_pagination(total: int, page: int = 1, per_page: int = 50) -> dict:
-    """Calculate pagination metadata"""
-    total_pages = (total + per_page - 1) // per_page
-    
-    return {
-        'total_items': total,
-        'total_pages': total_pages,
-        'current_page': page,
-        'per_page': per_page,
-        'has_next': page < total_pages,
-        'has_prev': page > 1,
-        'next_page': page + 1 if page < total_pages else None,
-        'prev_page': page - 1 if page > 1 else None
-    }
-
-
-def get_skip_limit(page: int = 1, per_page: int = 50) -> tuple:
-    """Convert page to skip/limit"""
-    skip = (page - 1) * per_page
-    return (skip, per_page)
-
-
-# ══════════════════════════════════════════════════════════════
-# STATISTICS
-# ══════════════════════════════════════════════════════════════
-
-def calculate_average(values: List[float]) -> float:
-    """Calculate average"""
-    return sum(values) / len(values) if values else 0
-
-
-def calculate_growth_rate(current: float, previous: float) -> float:
-    """Calculate growth rate percentage"""
-    if previous == 0:
-        return 100.0 if current > 0 else 0.0
-    return ((current - previous) / previous) * 100
-
-
-def calculate_conversion_rate(converted: int, total: int) -> float:
-    """Calculate conversion rate percentage"""
-    return (converted / total * 100) if total > 0 else 0.0
-
-
-# ══════════════════════════════════════════════════════════════
-# FILTERS & SEARCH
-# ══════════════════════════════════════════════════════════════
-
-def build_search_filter(search_term: str, fields: List[str]) -> str:
-    """Build SQL LIKE filter for search"""
-    return f"%{search_term}%"
-
-
-def parse_filter_params(params: dict) -> dict:
-    """Parse and validate filter parameters"""
-    filters = {}
-    
-    for key, value in params.items():
-        if value is not None and value != '':
-            filters[key] = value
-    
-    return filters
-
-
-# ══════════════════════════════════════════════════════════════
-# COLOR CODING (for UI)
-# ══════════════════════════════════════════════════════════════
-
-def get_status_color(status: str) -> str:
-    """Get color for status"""
-    colors = {
-        'lead': 'blue',
-        'prospect': 'yellow',
-        'customer': 'green',
-        'partner': 'purple',
-        'open': 'blue',
-        'won': 'green',
-        'lost': 'red',
-        'pending': 'yellow',
-        'completed': 'green',
-        'cancelled': 'red'
-    }
-    return colors.get(status.lower(), 'gray')
-
-
-def get_priority_color(priority: str) -> str:
-    """Get color for priority"""
-    colors = {
-        'low': 'green',
-        'medium': 'yellow',
-        'high': 'orange',
-        'critical': 'red'
-    }
-    return colors.get(priority.lower(), 'gray')
-
-
-def get_score_color(score: int) -> str:
-    """Get color based on lead score"""
-    if score >= 80:
-        return 'green'
-    elif score >= 50:
-        return 'yellow'
-    elif score >= 30:
-        return 'orange'
-    else:
-        return 'red'
\ No newline at end of file
+"""
+Utility Functions - Helper functions for CRM operations
+"""
+
+import uuid
+import hashlib
+import re
+import csv
+import io
+import json
+import base64
+import contextvars
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import attrgetter
+from datetime import datetime, timedelta, date
+from typing import List, Dict, NamedTuple, Optional
+
+# ══════════════════════════════════════════════════════════════
+# COMPILED PATTERNS
+# ══════════════════════════════════════════════════════════════
+
+# Compiled once at import: re.match(pattern, ...) pays a cache lookup
+# (and its lock) per call, which adds up in the bulk CSV import loops
+_PHONE_STRIP_RE = re.compile(r'[\s\-\(\)\+]')
+_URL_RE = re.compile(r'^https?://[^\s/$.?#].[^\s]*$', re.IGNORECASE)
+_NON_DIGIT_RE = re.compile(r'\D')
+_SLUG_DASH_RE = re.compile(r'[-\s]+')
+_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_WS_RE = re.compile(r'\s+')
+_UUID4_RE = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}\Z',
+    re.IGNORECASE,
+)
+
+# Character sets for the linear email scanner below
+_EMAIL_LOCAL_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-'
+)
+_EMAIL_DOMAIN_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-'
+)
+_ALPHA_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ')
+
+# Title keywords for lead scoring, matched in one scan. The lookahead
+# keeps matches non-consuming so overlapping terms ('vpresident' hits
+# both 'vp' and 'president') behave exactly like the old per-term
+# substring checks
+_EXEC_TITLE_TERMS = frozenset({'ceo', 'cto', 'cfo', 'vp', 'director', 'head'})
+_FOUNDER_TITLE_TERMS = frozenset({'president', 'founder', 'owner'})
+_TITLE_TERM_RE = re.compile(
+    r'(?=(' + '|'.join(
+        sorted(_EXEC_TITLE_TERMS | _FOUNDER_TITLE_TERMS, key=len, reverse=True)
+    ) + r'))'
+)
+
+# Slug translation table: lowercase, drop punctuation and turn
+# space/dash runs into '-' in one C-level str.translate pass, instead
+# of a .lower() plus two regex substitutions. Only sound for ASCII
+# input; anything wider takes the regex path below
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_TABLE = {}
+for _i in range(256):
+    _c = chr(_i)
+    if _c.isalnum() or _c == '_':
+        _SLUG_TABLE[_i] = _c.lower()
+    elif _c.isspace() or _c == '-':
+        _SLUG_TABLE[_i] = '-'
+    else:
+        _SLUG_TABLE[_i] = None
+del _i, _c
+
+# O(1) lookups for the scoring branches that searched lists/substrings
+_FREE_EMAIL_DOMAINS = frozenset({
+    'gmail.com', 'googlemail.com', 'yahoo.com', 'yahoo.co.uk',
+    'hotmail.com', 'hotmail.co.uk', 'outlook.com', 'live.com',
+})
+_HIGH_QUALITY_SOURCES = frozenset({'referral', 'partner'})
+_MEDIUM_QUALITY_SOURCES = frozenset({'web', 'campaign', 'event'})
+
+# ══════════════════════════════════════════════════════════════
+# USER ID MANAGEMENT
+# ══════════════════════════════════════════════════════════════
+
+def generate_user_id() -> str:
+    """Generate unique user ID (UUID4)"""
+    return str(uuid.uuid4())
+
+
+def validate_user_id(user_id: str) -> bool:
+    """
+    Validate user ID format (canonical UUID4)
+    A pattern match avoids constructing a UUID object per call; it also
+    genuinely enforces the version-4 and variant nibbles, which
+    uuid.UUID(s, version=4) merely overwrites
+    """
+    return isinstance(user_id, str) and _UUID4_RE.match(user_id) is not None
+
+
+def user_id_key(user_id: str) -> str:
+    """
+    Derive a 16-hex-char filename key from a user ID
+    A UUID4 is already uniformly random, so hashing adds no entropy;
+    parsing and slicing its hex is all the work actually needed
+    """
+    return uuid.UUID(user_id).hex[:16]
+
+
+def hash_user_id(user_id: str) -> str:
+    """
+    Create a 16-hex-char hash of user ID (for filenames)
+    Kept for arbitrary (non-UUID) inputs; prefer user_id_key when the
+    input is a UUID
+    """
+    return hashlib.blake2b(user_id.encode(), digest_size=8).hexdigest()
+
+
+# ══════════════════════════════════════════════════════════════
+# VALIDATION
+# ══════════════════════════════════════════════════════════════
+
+def validate_email(email: str) -> bool:
+    """
+    Validate email format (local@domain.tld)
+    Single linear pass over frozenset charsets: same accept set as the
+    old `^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$` regex, but
+    no NFA backtracking, so cost is strictly one check per character
+    even on pathological inputs
+    """
+    local, at, domain = email.partition('@')
+    if not at or not local:
+        return False
+    if not all(ch in _EMAIL_LOCAL_CHARS for ch in local):
+        return False
+
+    head, dot, tld = domain.rpartition('.')
+    if not dot or not head or len(tld) < 2:
+        return False
+    if not all(ch in _ALPHA_CHARS for ch in tld):
+        return False
+    return all(ch in _EMAIL_DOMAIN_CHARS for ch in head)
+
+
+def validate_phone(phone: str) -> bool:
+    """Validate phone number"""
+    cleaned = _PHONE_STRIP_RE.sub('', phone)
+    return cleaned.isdigit() and 7 <= len(cleaned) <= 15
+
+
+def validate_url(url: str) -> bool:
+    """Validate URL format"""
+    return bool(_URL_RE.match(url))
+
+
+# ══════════════════════════════════════════════════════════════
+# FORMATTING
+# ══════════════════════════════════════════════════════════════
+
+def format_currency(amount: float, currency: str = "USD") -> str:
+    """Format currency for display"""
+    symbols = {
+        "USD": "$",
+        "EUR": "€",
+        "GBP": "£",
+        "INR": "₹"
+    }
+    symbol = symbols.get(currency, currency + " ")
+    return f"{symbol}{amount:,.2f}"
+
+
+def format_phone(phone: str, format_type: str = "US") -> str:
+    """Format phone number"""
+    digits = _NON_DIGIT_RE.sub('', phone)
+    
+    if format_type == "US" and len(digits) == 10:
+        return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
+    elif format_type == "US" and len(digits) == 11 and digits[0] == '1':
+        return f"+1 ({digits[1:4]}) {digits[4:7]}-{digits[7:]}"
+    
+    return phone
+
+
+def format_percentage(value: float) -> str:
+    """Format as percentage"""
+    return f"{value:.1f}%"
+
+
+def truncate_text(text: str, max_length: int = 100) -> str:
+    """Truncate text with ellipsis"""
+    if len(text) <= max_length:
+        return text
+    return text[:max_length - 3] + "..."
+
+
+# ══════════════════════════════════════════════════════════════
+# DATE/TIME UTILITIES
+# ══════════════════════════════════════════════════════════════
+
+# Clock override for bulk jobs: date.today()/utcnow() hit the system
+# clock per call, and a report looping days_until over 50k rows pays
+# that 50k times for the same instant
+_now_override = contextvars.ContextVar('_now_override', default=None)
+
+
+def _now() -> datetime:
+    value = _now_override.get()
+    return value if value is not None else datetime.utcnow()
+
+
+def _today() -> date:
+    value = _now_override.get()
+    return value.date() if value is not None else date.today()
+
+
+@contextmanager
+def frozen_now(now: datetime):
+    """Pin the clock for the duration of a bulk loop"""
+    token = _now_override.set(now)
+    try:
+        yield now
+    finally:
+        _now_override.reset(token)
+
+
+def format_date(dt: datetime, format_str: str = "%Y-%m-%d") -> str:
+    """Format datetime to string"""
+    return dt.strftime(format_str)
+
+
+def format_datetime(dt: datetime) -> str:
+    """Format datetime with time"""
+    return dt.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def parse_date(date_str: str) -> date:
+    """Parse ISO date string"""
+    return datetime.fromisoformat(date_str).date()
+
+
+# Lazy range table: the old implementation materialized all six
+# (start, end) tuples per call and threw five away
+_RANGE_FNS = {
+    "today": lambda now: (
+        now.replace(hour=0, minute=0, second=0),
+        now.replace(hour=23, minute=59, second=59)
+    ),
+    "yesterday": lambda now: (
+        (now - timedelta(days=1)).replace(hour=0, minute=0, second=0),
+        (now - timedelta(days=1)).replace(hour=23, minute=59, second=59)
+    ),
+    "this_week": lambda now: (
+        now - timedelta(days=now.weekday()),
+        now
+    ),
+    "this_month": lambda now: (
+        now.replace(day=1, hour=0, minute=0, second=0),
+        now
+    ),
+    "last_30_days": lambda now: (
+        now - timedelta(days=30),
+        now
+    ),
+    "this_year": lambda now: (
+        now.replace(month=1, day=1, hour=0, minute=0, second=0),
+        now
+    )
+}
+
+
+def get_date_range(period: str) -> tuple:
+    """Get start and end dates for period"""
+    now = _now()
+    range_fn = _RANGE_FNS.get(period)
+    if range_fn is None:
+        return (now - timedelta(days=30), now)
+    return range_fn(now)
+
+
+def days_until(target: date) -> int:
+    """Calculate days until target date"""
+    delta = target - _today()
+    return delta.days
+
+
+def is_overdue(target: date) -> bool:
+    """Check if date is past"""
+    return target < _today()
+
+
+def days_until_many(targets: List[date]) -> List[int]:
+    """
+    Days until each target date
+    One clock read and ordinal subtraction per row - no per-row
+    timedelta allocation like looping days_until would cost
+    """
+    base = _today().toordinal()
+    return [t.toordinal() - base for t in targets]
+
+
+def is_overdue_many(targets: List[date]) -> List[bool]:
+    """Overdue flag for each target date, reading the clock once"""
+    today = _today()
+    return [t < today for t in targets]
+
+
+def get_quarter(dt: datetime) -> int:
+    """Get fiscal quarter (1-4)"""
+    return (dt.month - 1) // 3 + 1
+
+
+# ══════════════════════════════════════════════════════════════
+# CRM-SPECIFIC CALCULATIONS
+# ══════════════════════════════════════════════════════════════
+
+# Scoring rules, one per independent component. Keeping them separate
+# lets field updates rescore only the rules whose inputs changed
+
+def _score_presence(d: dict) -> int:
+    # Presence flags accumulate branchlessly: bool-to-int
+    # multiplication replaces data-dependent jumps per contact
+    get = d.get
+    return (
+        20 * bool(get('company_id'))        # company association
+        + 10 * bool(get('phone'))           # contact info
+        + 5 * bool(get('mobile'))
+        + 15 * bool(get('linkedin_url'))    # social presence
+        + 5 * bool(get('twitter_handle'))
+        # complete address
+        + 10 * all(get(f) for f in ('street', 'city', 'state', 'country'))
+    )
+
+
+def _score_title(d: dict) -> int:
+    # One scan finds every keyword instead of nine substring passes
+    title = d.get('title')
+    if not title:
+        return 0
+    matched = {m.group(1) for m in _TITLE_TERM_RE.finditer(title.lower())}
+    return (
+        10
+        + 10 * bool(matched & _EXEC_TITLE_TERMS)
+        + 15 * bool(matched & _FOUNDER_TITLE_TERMS)
+    )
+
+
+def _score_source(d: dict) -> int:
+    # Schema dumps carry the key with an explicit None, so a default
+    # on .get() alone doesn't cover the null case
+    source = (d.get('lead_source') or '').lower()
+    if source in _HIGH_QUALITY_SOURCES:
+        return 15
+    if source in _MEDIUM_QUALITY_SOURCES:
+        return 5
+    return 0
+
+
+def _score_email(d: dict) -> int:
+    # Corporate email: exact domain lookup, so 'name@notgmail.com'
+    # does not misclassify as a free provider
+    domain = extract_domain(d.get('email', ''))
+    return 10 if domain and domain not in _FREE_EMAIL_DOMAINS else 0
+
+
+# (rule name, input fields, scorer)
+_SCORE_RULES = (
+    ('presence', frozenset({
+        'company_id', 'phone', 'mobile', 'linkedin_url', 'twitter_handle',
+        'street', 'city', 'state', 'country',
+    }), _score_presence),
+    ('title', frozenset({'title'}), _score_title),
+    ('source', frozenset({'lead_source'}), _score_source),
+    ('email', frozenset({'email'}), _score_email),
+)
+
+
+def calculate_lead_score(contact_data: dict) -> int:
+    """
+    Calculate lead score (0-100) based on contact data
+    Higher score = better quality lead
+    """
+    return min(
+        _score_presence(contact_data)
+        + _score_title(contact_data)
+        + _score_source(contact_data)
+        + _score_email(contact_data),
+        100,
+    )
+
+
+def calculate_lead_score_parts(contact_data: dict) -> dict:
+    """Per-rule score breakdown, for use with update_lead_score"""
+    return {name: rule(contact_data) for name, _, rule in _SCORE_RULES}
+
+
+def update_lead_score(parts: dict, changed_fields, new_data: dict) -> int:
+    """
+    Rescore after a field update, recomputing only affected rules
+    `parts` is the breakdown from calculate_lead_score_parts and is
+    updated in place; workflow-triggered rescores pay O(rules touched)
+    instead of re-running the whole scorer
+    """
+    changed = frozenset(changed_fields)
+    for name, fields, rule in _SCORE_RULES:
+        if fields & changed:
+            parts[name] = rule(new_data)
+    return min(sum(parts.values()), 100)
+
+
+def calculate_lead_scores(contacts: List[dict]) -> List[int]:
+    """
+    Score a batch of contacts (daily recompute jobs)
+    Binds the scorer once and runs a list comprehension, so the batch
+    path pays one global lookup instead of one per contact
+    """
+    score = calculate_lead_score
+    return [score(c) for c in contacts]
+
+
+def calculate_deal_weighted_value(value: float, probability: int) -> float:
+    """Calculate weighted deal value"""
+    return value * (probability / 100)
+
+
+_STAGE_NUMBERS = {
+    'qualification': 1,
+    'needs_analysis': 2,
+    'proposal': 3,
+    'negotiation': 4,
+    'closed_won': 5,
+    'closed_lost': 6
+}
+
+
+@lru_cache(maxsize=32)
+def get_deal_stage_number(stage: str) -> int:
+    """Get stage number for sorting"""
+    return _STAGE_NUMBERS.get(stage.lower(), 0)
+
+
+def calculate_pipeline_metrics(deals: List[dict]) -> dict:
+    """
+    Calculate pipeline metrics
+    Single pass: the old version filtered the deal list twice and
+    summed three generators, five traversals with a dict .get() each -
+    interpreter-bound for large pipelines
+    """
+    total_value = 0.0
+    weighted_sum = 0.0
+    total_revenue = 0.0
+    open_count = 0
+    won_count = 0
+
+    for d in deals:
+        status = d.get('status')
+        if status == 'open':
+            value = d.get('value', 0)
+            total_value += value
+            weighted_sum += value * d.get('probability', 0)
+            open_count += 1
+        elif status == 'won':
+            total_revenue += d.get('value', 0)
+            won_count += 1
+
+    return {
+        'total_value': total_value,
+        'weighted_value': weighted_sum / 100.0,
+        'open_count': open_count,
+        'total_revenue': total_revenue,
+        'won_count': won_count
+    }
+
+
+_PRIORITY_NUMBERS = {
+    'low': 1,
+    'medium': 2,
+    'high': 3,
+    'critical': 4
+}
+
+
+@lru_cache(maxsize=32)
+def get_activity_priority_number(priority: str) -> int:
+    """Get priority number for sorting"""
+    return _PRIORITY_NUMBERS.get(priority.lower(), 2)
+
+
+# ══════════════════════════════════════════════════════════════
+# STRING UTILITIES
+# ══════════════════════════════════════════════════════════════
+
+def clean_string(text: str) -> str:
+    """Clean and normalize string"""
+    if not text:
+        return ""
+    # Whitespace collapse in one C-level regex pass; split+join builds
+    # an intermediate token list per call
+    return _WS_RE.sub(' ', text).strip()
+
+
+def slugify(text: str) -> str:
+    """Convert to URL-friendly slug"""
+    if text.isascii():
+        text = text.translate(_SLUG_TABLE)
+    else:
+        # The 256-entry table can't lowercase or strip beyond Latin-1
+        text = _SLUG_STRIP_RE.sub('', text.lower())
+    return _SLUG_DASH_RE.sub('-', text).strip('-')
+
+
+def parse_tags(tags_str: Optional[str]) -> List[str]:
+    """Parse comma-separated tags"""
+    if not tags_str:
+        return []
+    return [t.strip() for t in tags_str.split(',') if t.strip()]
+
+
+def format_tags(tags_list: List[str]) -> str:
+    """Format tags to comma-separated string"""
+    return ', '.join(t.strip() for t in tags_list if t.strip())
+
+
+def extract_domain(email: str) -> str:
+    """Extract domain from email"""
+    if '@' in email:
+        return email.split('@')[1].lower()
+    return ""
+
+
+def get_initials(first_name: str, last_name: str) -> str:
+    """Get initials from name"""
+    return f"{first_name[0]}{last_name[0]}".upper() if first_name and last_name else ""
+
+
+# ══════════════════════════════════════════════════════════════
+# EXPORT/IMPORT
+# ══════════════════════════════════════════════════════════════
+
+def export_to_csv_iter(records, fields: List[str]):
+    """
+    Yield CSV output row by row
+    Suitable for StreamingResponse: memory stays flat regardless of
+    export size and the client gets first bytes immediately, instead
+    of buffering the whole file like export_to_csv
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(fields)
+    yield buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate()
+
+    # attrgetter grabs the whole row in one C call, against one
+    # Python-level getattr per cell in the old loop; csv.writer on a
+    # value sequence also skips DictWriter's per-row dict shuffling.
+    # Records missing a field fall back to the per-cell path so they
+    # emit empty cells instead of crashing mid-stream
+    get_row = attrgetter(*fields)
+    single_field = len(fields) == 1
+
+    for record in records:
+        try:
+            values = get_row(record)
+            if single_field:
+                values = (values,)
+        except AttributeError:
+            values = tuple(getattr(record, field, None) for field in fields)
+        writer.writerow([
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in values
+        ])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def export_to_csv(records: List, fields: List[str]) -> str:
+    """Export records to CSV string"""
+    return ''.join(export_to_csv_iter(records, fields))
+
+
+def _parse_date_fast(v):
+    # Cheap shape check first: blank and obviously-malformed cells are
+    # common in imported CSVs, and rejecting them here skips building a
+    # ValueError just to have the row parser swallow it
+    if not v or len(v) < 10 or v[4] != '-' or v[7] != '-':
+        return None
+    try:
+        return datetime.fromisoformat(v).date()
+    except ValueError:
+        return None
+
+
+def _parse_datetime_fast(v):
+    if not v or len(v) < 10 or v[4] != '-' or v[7] != '-':
+        return None
+    try:
+        return datetime.fromisoformat(v)
+    except ValueError:
+        return None
+
+
+# Type-name -> converter dispatch for CSV imports; one dict lookup per
+# cell instead of walking an if/elif chain of string comparisons
+_CONVERTERS = {
+    'int': lambda v: int(v) if v else None,
+    'float': lambda v: float(v) if v else None,
+    'bool': lambda v: v.lower() in ('true', '1', 'yes') if v else False,
+    'date': _parse_date_fast,
+    'datetime': _parse_datetime_fast,
+}
+
+
+def compile_row_parser(field_types: dict):
+    """
+    Resolve the per-field converters once and return a row parser
+    Bulk imports should compile the parser outside the loop so the
+    per-row cost is just the conversions themselves
+    """
+    resolved = {
+        field: _CONVERTERS.get(type_name)
+        for field, type_name in field_types.items()
+    }
+    get_converter = resolved.get
+
+    def parse(row: dict) -> dict:
+        parsed = {}
+        for field, value in row.items():
+            converter = get_converter(field)
+            if converter is None:
+                parsed[field] = value
+            else:
+                try:
+                    parsed[field] = converter(value)
+                except (ValueError, TypeError):
+                    parsed[field] = None
+        return parsed
+
+    return parse
+
+
+def parse_csv_row(row: dict, field_types: dict) -> dict:
+    """Parse CSV row with type conversion"""
+    return compile_row_parser(field_types)(row)
+
+
+def sanitize_filename(filename: str) -> str:
+    """Sanitize filename"""
+    filename = _FILENAME_RE.sub('', filename)
+    filename = filename.strip('. ')
+    return filename[:255] or 'untitled'
+
+
+# ══════════════════════════════════════════════════════════════
+# PAGINATION
+# ══════════════════════════════════════════════════════════════
+
+class Pagination(NamedTuple):
+    """Pagination metadata; use ._asdict() where a dict is needed"""
+    total_items: int
+    total_pages: int
+    current_page: int
+    per_page: int
+    has_next: bool
+    has_prev: bool
+    next_page: Optional[int]
+    prev_page: Optional[int]
+
+
+def calculate_pagination(total: int, page: int = 1, per_page: int = 50) -> Pagination:
+    """
+    Calculate pagination metadata
+    A NamedTuple allocates one fixed-size object per response where
+    the old 8-key dict cost a hash table plus GC pressure on hot paths
+    """
+    total_pages = (total + per_page - 1) // per_page
+    has_next = page < total_pages
+    has_prev = page > 1
+
+    return Pagination(
+        total_items=total,
+        total_pages=total_pages,
+        current_page=page,
+        per_page=per_page,
+        has_next=has_next,
+        has_prev=has_prev,
+        next_page=page + 1 if has_next else None,
+        prev_page=page - 1 if has_prev else None
+    )
+
+
+def get_skip_limit(page: int = 1, per_page: int = 50) -> tuple:
+    """Convert page to skip/limit"""
+    skip = (page - 1) * per_page
+    return (skip, per_page)
+
+
+def encode_cursor(sort_value, last_id: int) -> str:
+    """Encode keyset cursor (last sort value + row id) as base64 JSON"""
+    payload = json.dumps([sort_value, last_id], default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """Decode keyset cursor back to (sort_value, id); raises ValueError"""
+    try:
+        sort_value, last_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode()).decode()
+        )
+        return (sort_value, int(last_id))
+    except (ValueError, TypeError, json.JSONDecodeError):
+        raise ValueError("Invalid cursor")
+
+
+# ══════════════════════════════════════════════════════════════
+# STATISTICS
+# ══════════════════════════════════════════════════════════════
+
+def calculate_average(values: List[float]) -> float:
+    """Calculate average"""
+    return sum(values) / len(values) if values else 0
+
+
+def calculate_growth_rate(current: float, previous: float) -> float:
+    """Calculate growth rate percentage"""
+    if previous == 0:
+        return 100.0 if current > 0 else 0.0
+    return ((current - previous) / previous) * 100
+
+
+def calculate_conversion_rate(converted: int, total: int) -> float:
+    """Calculate conversion rate percentage"""
+    return (converted / total * 100) if total > 0 else 0.0
+
+
+# ══════════════════════════════════════════════════════════════
+# FILTERS & SEARCH
+# ══════════════════════════════════════════════════════════════
+
+def build_search_filter(search_term: str, fields: List[str]) -> str:
+    """Build SQL LIKE filter for search"""
+    return f"%{search_term}%"
+
+
+def parse_filter_params(params: dict) -> dict:
+    """Parse and validate filter parameters"""
+    filters = {}
+    
+    for key, value in params.items():
+        if value is not None and value != '':
+            filters[key] = value
+    
+    return filters
+
+
+# ══════════════════════════════════════════════════════════════
+# COLOR CODING (for UI)
+# ══════════════════════════════════════════════════════════════
+
+# Tiny fixed input domains: lru_cache turns the repeat calls made
+# while sorting large lists into a single hash probe, skipping the
+# .lower() allocation after warmup
+_STATUS_COLORS = {
+    'lead': 'blue',
+    'prospect': 'yellow',
+    'customer': 'green',
+    'partner': 'purple',
+    'open': 'blue',
+    'won': 'green',
+    'lost': 'red',
+    'pending': 'yellow',
+    'completed': 'green',
+    'cancelled': 'red'
+}
+
+
+@lru_cache(maxsize=64)
+def get_status_color(status: str) -> str:
+    """Get color for status"""
+    return _STATUS_COLORS.get(status.lower(), 'gray')
+
+
+_PRIORITY_COLORS = {
+    'low': 'green',
+    'medium': 'yellow',
+    'high': 'orange',
+    'critical': 'red'
+}
+
+
+@lru_cache(maxsize=32)
+def get_priority_color(priority: str) -> str:
+    """Get color for priority"""
+    return _PRIORITY_COLORS.get(priority.lower(), 'gray')
+
+
+# One entry per score 0-100; the clamp-and-index below replaces the
+# old threshold chain with a single branch-free lookup
+_SCORE_COLORS = ['red'] * 30 + ['orange'] * 20 + ['yellow'] * 30 + ['green'] * 21
+
+
+def get_score_color(score: int) -> str:
+    """Get color based on lead score"""
+    return _SCORE_COLORS[max(0, min(100, score))]
\ No newline at end of file